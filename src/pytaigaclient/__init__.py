@@ -1,4 +1,5 @@
-from .client import TaigaClient
+from typing import TYPE_CHECKING
+
 from .exceptions import (
     TaigaException,
     TaigaAPIError,
@@ -12,6 +13,7 @@ from .exceptions import (
 
 __all__ = [
     "TaigaClient",
+    "AsyncTaigaClient",
     "TaigaException",
     "TaigaAPIError",
     "TaigaAuthenticationError",
@@ -21,3 +23,19 @@ __all__ = [
     "TaigaRateLimitError",
     "TaigaServerError",
 ]
+
+if TYPE_CHECKING:
+    from .async_client import AsyncTaigaClient
+    from .client import TaigaClient
+
+
+def __getattr__(name):
+    # The clients pull in their HTTP stack and every resource module, so they
+    # are imported on first access; importing the exceptions alone stays cheap.
+    if name == "TaigaClient":
+        from .client import TaigaClient
+        return TaigaClient
+    if name == "AsyncTaigaClient":
+        from .async_client import AsyncTaigaClient
+        return AsyncTaigaClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,364 @@
+import asyncio
+import httpx
+import logging
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple, Union
+from urllib.parse import urlencode, urljoin
+
+try:
+    import orjson  # Optional, faster JSON decoding of API responses
+except ImportError:
+    orjson = None
+
+from .exceptions import TaigaException, handle_api_error
+from .resources.aio import (
+    AsyncAuth, AsyncProjects, AsyncUserStories, AsyncTasks, AsyncIssues,
+    AsyncUserStoryStatuses
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTaigaClient:
+    """
+    Asynchronous client for the Taiga API, built on httpx.AsyncClient.
+
+    Mirrors TaigaClient for the read-heavy endpoints so that callers running
+    inside an event loop can await requests without a thread pool.
+    """
+    DEFAULT_API_VERSION = "/api/v1/"
+
+    def __init__(
+        self,
+        host: str,
+        auth_token: Optional[str] = None,
+        token_type: str = "Bearer",  # Or "Application"
+        api_version: str = DEFAULT_API_VERSION,
+        session: Optional[httpx.AsyncClient] = None,
+        default_timeout: Optional[float] = 30,
+        accept_language: str = "en",
+        disable_pagination: bool = False,
+        etag_cache_size: int = 256,
+    ):
+        """
+        Initializes the AsyncTaigaClient.
+
+        Args:
+            host: The base URL of the Taiga instance (e.g., "https://api.taiga.io").
+            auth_token: The authentication token (Bearer or Application).
+            token_type: Type of the token ("Bearer" or "Application").
+            api_version: The API version path (default: "/api/v1/").
+            session: An optional httpx.AsyncClient (pool limits, transport, retries).
+            default_timeout: Default timeout for requests in seconds (None uses the session's timeout).
+            accept_language: Default 'Accept-Language' header value.
+            disable_pagination: If True, sets the 'x-disable-pagination' header.
+            etag_cache_size: Maximum number of responses kept for conditional GETs (0 disables).
+        """
+        if not host:
+            raise ValueError("Taiga host URL cannot be empty.")
+        self.host = host.rstrip('/')
+        self.api_base_url = urljoin(self.host, api_version.strip('/') + '/')
+        self.auth_token = auth_token
+        self.token_type = token_type
+        self.session = session or httpx.AsyncClient()
+        self.default_timeout = default_timeout
+        self.accept_language = accept_language
+        self.disable_pagination = disable_pagination
+        self.etag_cache_size = etag_cache_size
+        # Maps a GET URL (with query string) to its last (ETag, decoded body).
+        # Only touched from the event loop, so no lock is needed.
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+        self._update_session_headers()
+
+        # Initialize resource endpoints
+        self.auth = AsyncAuth(self)
+        self.projects = AsyncProjects(self)
+        self.user_stories = AsyncUserStories(self)
+        self.tasks = AsyncTasks(self)
+        self.issues = AsyncIssues(self)
+        self.userstory_statuses = AsyncUserStoryStatuses(self)
+
+    async def aclose(self):
+        """Closes the underlying HTTP connection pool."""
+        await self.session.aclose()
+
+    def update_token(self, auth_token: Optional[str], token_type: str = "Bearer"):
+        """Updates the authentication token and type."""
+        self.auth_token = auth_token
+        self.token_type = token_type
+        self._update_session_headers()
+
+    def _update_session_headers(self):
+        """Updates the common headers in the session."""
+        self.session.headers["Accept-Language"] = self.accept_language
+        # Expect JSON responses
+        self.session.headers["Accept"] = "application/json"
+        if self.disable_pagination:
+            self.session.headers["x-disable-pagination"] = "True"
+        else:
+            self.session.headers.pop("x-disable-pagination", None)
+
+        if self.auth_token:
+            self.session.headers["Authorization"] = f"{self.token_type} {self.auth_token}"
+        else:
+            self.session.headers.pop("Authorization", None)
+
+    def _build_url(self, path: str) -> str:
+        """Builds the full API URL for a given path."""
+        return urljoin(self.api_base_url, path.lstrip('/'))
+
+    @staticmethod
+    def _encode_params(params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Drops None values and encodes booleans the way requests does ('True'/'False')."""
+        if not params:
+            return params
+        return {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in params.items()
+            if value is not None
+        }
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        raise_exception: bool = True,
+        authenticated: bool = True
+    ) -> Optional[Union[Dict, List, Any]]:
+        """
+        Makes an HTTP request to the Taiga API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE).
+            path: API endpoint path (e.g., "/projects", "/users/me").
+            params: URL query parameters.
+            json: Data for POST/PUT/PATCH (automatically JSON-encoded).
+            headers: Additional request headers.
+            timeout: Request timeout in seconds.
+            raise_exception: Whether to raise TaigaAPIError on failure.
+            authenticated: Whether to send the session's Authorization header.
+
+        Returns:
+            Decoded JSON response if successful and content exists, otherwise None.
+
+        Raises:
+            TaigaAPIError or its subclasses on API errors if raise_exception is True.
+            TaigaException on connection errors.
+        """
+        response = await self._send(
+            method, path, params=params, json=json, headers=headers,
+            timeout=timeout, raise_exception=raise_exception,
+            authenticated=authenticated
+        )
+        if response is None:
+            return None
+        return self._decode_response(method, response)
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        raise_exception: bool = True,
+        authenticated: bool = True
+    ) -> Optional[httpx.Response]:
+        """
+        Sends an HTTP request to the Taiga API and returns the raw response.
+
+        Accepts the same arguments as `_request`. Session headers are merged
+        by httpx, so only the per-request extras are passed along.
+
+        Returns:
+            The response object, or None if the API returned an error and
+            raise_exception is False.
+        """
+        full_url = self._build_url(path)
+        params = self._encode_params(params)
+
+        logger.debug("Request: %s %s", method, full_url)
+        logger.debug("Params: %s", params)
+        logger.debug("Json: %s", json)
+
+        request = self.session.build_request(
+            method,
+            full_url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=timeout or self.default_timeout or httpx.USE_CLIENT_DEFAULT
+        )
+        if not authenticated:
+            # Dropped from this request only; concurrent requests keep the session's token
+            request.headers.pop("Authorization", None)
+
+        try:
+            response = await self.session.send(request)
+        except httpx.HTTPError as e:
+            logger.error("Request failed: %s", e)
+            raise TaigaException(f"Request failed: {e}") from e
+
+        logger.debug("Response Status: %s", response.status_code)
+
+        if response.is_error:
+            logger.error(
+                "API Error: %s - %s", response.status_code, response.text)
+            if raise_exception:
+                handle_api_error(response)
+            return None
+
+        return response
+
+    def _decode_response(self, method: str, response: httpx.Response) -> Optional[Union[Dict, List, Any]]:
+        """Decodes a successful response body."""
+        if response.status_code == 204:  # No Content
+            return None
+
+        try:
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        except ValueError:  # json's and orjson's JSONDecodeError both subclass it
+            logger.warning(
+                "Non-JSON success response received for %s %s", method, response.url)
+            return response.text
+
+    async def _conditional_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Optional[Union[Dict, List, Any]]:
+        """
+        Makes a GET request revalidated with the last seen ETag ('If-None-Match').
+
+        On '304 Not Modified' the previously decoded body is returned without
+        transferring or parsing it again.
+        """
+        key = self._build_url(path)
+        if params:
+            key += "?" + urlencode(sorted(params.items()), doseq=True)
+        cached = self._etag_cache.get(key)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers["If-None-Match"] = cached[0]
+
+        response = await self._send("GET", path, params=params, headers=request_headers, **kwargs)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        result = self._decode_response("GET", response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache.pop(key, None)
+            if len(self._etag_cache) >= self.etag_cache_size:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._etag_cache.pop(next(iter(self._etag_cache)), None)
+            self._etag_cache[key] = (etag, result)
+        return result
+
+    # Convenience methods
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, conditional: bool = False, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        # 'conditional' revalidates against a cached ETag instead of refetching the body
+        if conditional and self.etag_cache_size > 0:
+            return await self._conditional_get(path, params=params, **kwargs)
+        return await self._request("GET", path, params=params, **kwargs)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        return await self._request("POST", path, json=json, **kwargs)
+
+    async def patch(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        return await self._request("PATCH", path, json=json, **kwargs)
+
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        return await self._request("PUT", path, json=json, **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        return await self._request("DELETE", path, **kwargs)
+
+    async def _get_page(self, path: str, params: Dict[str, Any], page: int) -> Tuple[httpx.Response, Any]:
+        """Fetches one page of a list endpoint, returning the response and its decoded body."""
+        response = await self._send("GET", path, params={**params, "page": page})
+        return response, self._decode_response("GET", response)
+
+    async def iter_pages(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = 100,
+        concurrency: int = 8,
+    ) -> AsyncIterator[List[Any]]:
+        """
+        Iterates over a paginated list endpoint, yielding one page of results at a time.
+
+        When the first page reports the total item count ('x-pagination-count'),
+        the remaining pages are requested concurrently and yielded in order.
+        Otherwise the 'x-pagination-next' header is followed page by page. When
+        pagination is disabled server-side, the single unpaginated list is yielded.
+
+        Args:
+            path: API endpoint path (e.g., "/userstories").
+            params: URL query parameters (filters).
+            page_size: Number of items requested per page.
+            concurrency: Maximum number of pages requested at the same time.
+
+        Yields:
+            Lists of decoded items, one per page.
+        """
+        page_params = dict(params or {})
+        page_params["page_size"] = page_size
+        response, items = await self._get_page(path, page_params, 1)
+        if not isinstance(items, list):
+            return
+        yield items
+        if not response.headers.get("x-pagination-next"):
+            return
+
+        try:
+            total = int(response.headers["x-pagination-count"])
+            per_page = int(response.headers.get("x-paginated-by") or page_size)
+            last_page = -(-total // per_page)
+        except (KeyError, ValueError, ZeroDivisionError):
+            last_page = None
+
+        if last_page is None:
+            page = 2
+            while True:
+                response, items = await self._get_page(path, page_params, page)
+                if not isinstance(items, list):
+                    return
+                yield items
+                if not response.headers.get("x-pagination-next"):
+                    return
+                page += 1
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> Any:
+            async with semaphore:
+                return (await self._get_page(path, page_params, page))[1]
+
+        tasks = [asyncio.ensure_future(fetch(page)) for page in range(2, last_page + 1)]
+        try:
+            for task in tasks:
+                items = await task
+                if not isinstance(items, list):
+                    return
+                yield items
+        finally:
+            # Stop pages nobody will read; collect errors from finished ones
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()
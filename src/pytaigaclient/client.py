@@ -1,7 +1,13 @@
 import requests
 import logging
-from typing import Optional, Dict, Any, List, Union, IO
-from urllib.parse import urljoin
+import threading
+from typing import Optional, Dict, Any, Iterator, List, Tuple, Union, IO
+from urllib.parse import urlencode, urljoin
+
+try:
+    import orjson  # Optional, faster JSON decoding of API responses
+except ImportError:
+    orjson = None
 
 from .exceptions import TaigaException, handle_api_error
 from .resources.auth import Auth
@@ -47,6 +53,7 @@ class TaigaClient:
         default_timeout: int = 30,
         accept_language: str = "en",
         disable_pagination: bool = False,
+        etag_cache_size: int = 256,
     ):
         """
         Initializes the TaigaClient.
@@ -60,6 +67,7 @@ class TaigaClient:
             default_timeout: Default timeout for requests in seconds.
             accept_language: Default 'Accept-Language' header value.
             disable_pagination: If True, sets the 'x-disable-pagination' header.
+            etag_cache_size: Maximum number of responses kept for conditional GETs (0 disables).
         """
         if not host:
             raise ValueError("Taiga host URL cannot be empty.")
@@ -71,6 +79,10 @@ class TaigaClient:
         self.default_timeout = default_timeout
         self.accept_language = accept_language
         self.disable_pagination = disable_pagination
+        self.etag_cache_size = etag_cache_size
+        # Maps a GET URL (with query string) to its last (ETag, decoded body)
+        self._etag_cache: Dict[str, Tuple[str, Any]] = {}
+        self._etag_lock = threading.Lock()
 
         self._update_session_headers()
 
@@ -162,6 +174,36 @@ class TaigaClient:
             TaigaAPIError or its subclasses on API errors if raise_exception is True.
             requests.exceptions.RequestException on connection errors.
         """
+        response = self._send(
+            method, path, params=params, data=data, json=json, files=files,
+            headers=headers, timeout=timeout, raise_exception=raise_exception
+        )
+        if response is None:
+            return None
+        return self._decode_response(method, response)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        # requests uses 'json' for auto-serialization
+        json: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Union[IO, tuple]]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        raise_exception: bool = True
+    ) -> Optional[requests.Response]:
+        """
+        Sends an HTTP request to the Taiga API and returns the raw response.
+
+        Accepts the same arguments as `_request`.
+
+        Returns:
+            The response object, or None if the API returned an error and
+            raise_exception is False.
+        """
         full_url = self._build_url(path)
         request_headers = self.session.headers.copy()
         if headers:
@@ -180,11 +222,11 @@ class TaigaClient:
             json = data  # Move data to json param for requests
             data = None
 
-        logger.debug(f"Request: {method} {full_url}")
-        logger.debug(f"Params: {params}")
-        logger.debug(f"Data: {data}")
-        logger.debug(f"Json: {json}")
-        logger.debug(f"Headers: {request_headers}")
+        logger.debug("Request: %s %s", method, full_url)
+        logger.debug("Params: %s", params)
+        logger.debug("Data: %s", data)
+        logger.debug("Json: %s", json)
+        logger.debug("Headers: %s", request_headers)
 
         try:
             response = self.session.request(
@@ -198,34 +240,83 @@ class TaigaClient:
                 timeout=timeout or self.default_timeout
             )
 
-            logger.debug(f"Response Status: {response.status_code}")
+            logger.debug("Response Status: %s", response.status_code)
             # Log response body carefully, might be large
-            # logger.debug(f"Response Body: {response.text[:500]}...")
+            # logger.debug("Response Body: %s...", response.text[:500])
 
             if not response.ok:
                 logger.error(
-                    f"API Error: {response.status_code} - {response.text}")
+                    "API Error: %s - %s", response.status_code, response.text)
                 if raise_exception:
                     handle_api_error(response)
                 return None  # Or response object itself if needed?
 
-            if response.status_code == 204:  # No Content
-                return None
-
-            # Handle potential non-JSON success responses if necessary
-            try:
-                return response.json()
-            except requests.exceptions.JSONDecodeError:
-                logger.warning(
-                    f"Non-JSON success response received for {method} {full_url}")
-                return response.text  # Or handle differently if needed
+            return response
 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed: {e}")
+            logger.error("Request failed: %s", e)
             raise TaigaException(f"Request failed: {e}") from e
 
+    def _decode_response(self, method: str, response: requests.Response) -> Optional[Union[Dict, List, Any]]:
+        """Decodes a successful response body."""
+        if response.status_code == 204:  # No Content
+            return None
+
+        # Handle potential non-JSON success responses if necessary
+        try:
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        except ValueError:  # requests' and orjson's JSONDecodeError both subclass it
+            logger.warning(
+                "Non-JSON success response received for %s %s", method, response.url)
+            return response.text  # Or handle differently if needed
+
+    def _conditional_get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs
+    ) -> Optional[Union[Dict, List, Any]]:
+        """
+        Makes a GET request revalidated with the last seen ETag ('If-None-Match').
+
+        On '304 Not Modified' the previously decoded body is returned without
+        transferring or parsing it again.
+        """
+        key = self._build_url(path)
+        if params:
+            key += "?" + urlencode(sorted(params.items()), doseq=True)
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers["If-None-Match"] = cached[0]
+
+        response = self._send("GET", path, params=params, headers=request_headers, **kwargs)
+        if response is None:
+            return None
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+
+        result = self._decode_response("GET", response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache.pop(key, None)
+                if len(self._etag_cache) >= self.etag_cache_size:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._etag_cache.pop(next(iter(self._etag_cache)), None)
+                self._etag_cache[key] = (etag, result)
+        return result
+
     # Convenience methods
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Union[Dict, List, Any]]:
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None, conditional: bool = False, **kwargs) -> Optional[Union[Dict, List, Any]]:
+        # 'conditional' revalidates against a cached ETag instead of refetching the body
+        if conditional and self.etag_cache_size > 0:
+            return self._conditional_get(path, params=params, **kwargs)
         return self._request("GET", path, params=params, **kwargs)
 
     def post(self, path: str, data: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None, files: Optional[Dict[str, Any]] = None, **kwargs) -> Optional[Union[Dict, List, Any]]:
@@ -246,3 +337,32 @@ class TaigaClient:
 
     def delete(self, path: str, **kwargs) -> Optional[Union[Dict, List, Any]]:
         return self._request("DELETE", path, **kwargs)
+
+    def iter_pages(self, path: str, params: Optional[Dict[str, Any]] = None, page_size: int = 100) -> Iterator[List[Any]]:
+        """
+        Iterates over a paginated list endpoint, yielding one page of results at a time.
+
+        Follows the 'x-pagination-next' response header until the last page. When
+        pagination is disabled server-side, the single unpaginated list is yielded.
+
+        Args:
+            path: API endpoint path (e.g., "/userstories").
+            params: URL query parameters (filters).
+            page_size: Number of items requested per page.
+
+        Yields:
+            Lists of decoded items, one per page.
+        """
+        page_params = dict(params or {})
+        page_params["page_size"] = page_size
+        page = 1
+        while True:
+            page_params["page"] = page
+            response = self._send("GET", path, params=page_params)
+            items = self._decode_response("GET", response)
+            if not isinstance(items, list):
+                return
+            yield items
+            if not response.headers.get("x-pagination-next"):
+                return
+            page += 1
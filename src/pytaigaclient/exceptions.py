@@ -1,4 +1,8 @@
-import requests
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
 
 
 class TaigaException(Exception):
@@ -9,13 +13,13 @@ class TaigaException(Exception):
 class TaigaAPIError(TaigaException):
     """Represents an error returned by the Taiga API."""
 
-    def __init__(self, status_code: int, response: requests.Response):
+    def __init__(self, status_code: int, response: "requests.Response | httpx.Response"):
         self.status_code = status_code
         self.response = response
         try:
             self.error_detail = response.json().get(
                 '_error_message', 'No error message provided by API.')
-        except requests.exceptions.JSONDecodeError:
+        except ValueError:  # requests' and httpx's JSON decode errors both subclass it
             self.error_detail = response.text or "Non-JSON error response."
         super().__init__(f"API Error {status_code}: {self.error_detail}")
 
@@ -50,7 +54,7 @@ class TaigaServerError(TaigaAPIError):
     pass
 
 
-def handle_api_error(response: requests.Response):
+def handle_api_error(response: "requests.Response | httpx.Response"):
     """Raises the appropriate TaigaAPIError based on status code."""
     status_code = response.status_code
     if 400 <= status_code < 500:
@@ -0,0 +1,173 @@
+# taiga_client/resources/aio.py
+
+from typing import TYPE_CHECKING, Optional, Dict, Any, AsyncIterator, List, Union, cast
+
+if TYPE_CHECKING:
+    # Avoid circular import for type hinting
+    from ..async_client import AsyncTaigaClient
+
+
+class AsyncResource:
+    """
+    Base class for resources of the asynchronous Taiga client.
+    """
+
+    def __init__(self, client: "AsyncTaigaClient"):
+        """
+        Initialize a resource with an async Taiga client.
+
+        Args:
+            client: The AsyncTaigaClient instance.
+        """
+        self._client = client
+
+
+class AsyncAuth(AsyncResource):
+    """
+    Async counterpart of Auth (normal login only).
+    """
+
+    async def login(self, username: str, password: str) -> Dict[str, Any]:
+        """
+        Performs normal login using username/email and password.
+        Updates the client's token upon successful authentication.
+
+        Ref: 3.1. Normal login
+
+        Raises:
+            TaigaAuthenticationError: If login fails.
+            TaigaAPIError: For other API-related errors.
+            TaigaException: For connection errors.
+        """
+        payload = {
+            "type": "normal",
+            "username": username,
+            "password": password
+        }
+        # Auth endpoint doesn't require prior authentication token. The session's
+        # headers are left alone so requests in flight keep the current token
+        # until update_token() replaces it.
+        response_data = cast(Dict[str, Any], await self._client.post(
+            "/auth", json=payload, authenticated=False))
+        if response_data and 'auth_token' in response_data:
+            self._client.update_token(
+                auth_token=response_data['auth_token'],
+                token_type="Bearer"  # Normal login uses Bearer token
+            )
+        return response_data
+
+
+class AsyncProjects(AsyncResource):
+    """
+    Async counterpart of Projects (read endpoints).
+    """
+
+    async def list(self, **query_params) -> List[Dict[str, Any]]:
+        """Lists projects, optionally filtered (e.g., member, is_backlog_activated)."""
+        result = await self._client.get("/projects", params=query_params)
+        return result if isinstance(result, list) else []
+
+    async def get(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Gets details of a specific project by its ID."""
+        result = await self._client.get(f"/projects/{project_id}", conditional=True)
+        return result if isinstance(result, dict) else None
+
+
+class AsyncUserStoryStatuses(AsyncResource):
+    """
+    Async counterpart of UserStoryStatuses (read endpoints).
+    """
+
+    async def list(self, query_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Lists user story statuses (e.g., filtered by project)."""
+        result = await self._client.get("/userstory-statuses", params=query_params)
+        return result if isinstance(result, list) else []
+
+
+class AsyncUserStories(AsyncResource):
+    """
+    Async counterpart of UserStories (read endpoints).
+    """
+
+    async def list(self, **query_params) -> List[Dict[str, Any]]:
+        """Lists user stories, optionally filtered (e.g., project, milestone, status)."""
+        result = await self._client.get("/userstories", params=query_params)
+        return result if isinstance(result, list) else []
+
+    def list_pages(self, page_size: int = 100, **query_params) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over all pages of user stories matching the filters."""
+        return self._client.iter_pages("/userstories", params=query_params, page_size=page_size)
+
+    async def list_comments(self, user_story_id: int) -> List[Dict[str, Any]]:
+        """Lists comments for a specific user story."""
+        if not isinstance(user_story_id, int):
+            raise ValueError("user_story_id must be an integer")
+
+        result = await self._client.get(f"/history/userstory/{user_story_id}", params={"type": "comment"})
+        return result if isinstance(result, list) else []
+
+    async def get(self, user_story_id: int) -> Optional[Dict[str, Any]]:
+        """Gets details of a specific user story by its ID."""
+        result = await self._client.get(f"/userstories/{user_story_id}", conditional=True)
+        return result if isinstance(result, dict) else None
+
+    async def get_by_ref(self, ref: int, project: Union[int, str]) -> Optional[Dict[str, Any]]:
+        """Gets a user story by its reference number and project ID/slug."""
+        param_key = "project__slug" if isinstance(project, str) else "project"
+        params = {"ref": ref, param_key: project}
+        result = await self._client.get("/userstories/by_ref", params=params)
+        return result if isinstance(result, dict) else None
+
+
+class AsyncTasks(AsyncResource):
+    """
+    Async counterpart of Tasks (read endpoints).
+    """
+
+    async def list(self, query_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Lists tasks (e.g., filtered by project, status, user_story, assigned_to)."""
+        result = await self._client.get("/tasks", params=query_params)
+        return result if isinstance(result, list) else []
+
+    def list_pages(self, query_params: Optional[Dict[str, Any]] = None, page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over all pages of tasks matching the filters."""
+        return self._client.iter_pages("/tasks", params=query_params, page_size=page_size)
+
+    async def get(self, task_id: int) -> Dict[str, Any]:
+        """Retrieves details of a specific task by its ID."""
+        result = await self._client.get(f"/tasks/{task_id}", conditional=True)
+        return result if isinstance(result, dict) else {}
+
+    async def get_by_ref(self, ref: int, project: Union[int, str]) -> Dict[str, Any]:
+        """Retrieves a task by its reference number and project ID/slug."""
+        param_key = "project__slug" if isinstance(project, str) else "project"
+        params = {"ref": ref, param_key: project}
+        result = await self._client.get("/tasks/by_ref", params=params)
+        return result if isinstance(result, dict) else {}
+
+
+class AsyncIssues(AsyncResource):
+    """
+    Async counterpart of Issues (read endpoints).
+    """
+
+    async def list(self, query_params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Lists issues (e.g., filtered by project, status, severity, priority, tags)."""
+        result = await self._client.get("/issues", params=query_params)
+        return result if isinstance(result, list) else []
+
+    def list_pages(self, query_params: Optional[Dict[str, Any]] = None, page_size: int = 100) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterates over all pages of issues matching the filters."""
+        return self._client.iter_pages("/issues", params=query_params, page_size=page_size)
+
+    async def get(self, issue_id: int) -> Dict[str, Any]:
+        """Retrieves details of a specific issue by its ID."""
+        result = await self._client.get(f"/issues/{issue_id}", conditional=True)
+        return result if isinstance(result, dict) else {}
+
+    async def get_by_ref(self, ref: int, project: Union[int, str]) -> Dict[str, Any]:
+        """Retrieves an issue by its reference number and project ID/slug."""
+        param_key = "project__slug" if isinstance(project, str) else "project"
+        params = {"ref": ref, param_key: project}
+        result = await self._client.get("/issues/by_ref", params=params)
+        return result if isinstance(result, dict) else {}
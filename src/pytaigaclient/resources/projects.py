@@ -67,7 +67,7 @@ class Projects(Resource):
         Returns:
             A dictionary representing the project details.
         """
-        return self.client.get(f"/projects/{project_id}")
+        return self.client.get(f"/projects/{project_id}", conditional=True)
 
     def get_by_slug(self, slug: str) -> Dict[str, Any]:
         """
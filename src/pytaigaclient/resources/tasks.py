@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from .base import Resource
 
@@ -24,6 +24,22 @@ class Tasks(Resource):
         endpoint = "/tasks"
         return self.client.get(endpoint, params=query_params)
 
+    def list_pages(
+        self, query_params: Optional[Dict[str, Any]] = None, page_size: int = 100
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        List tasks page by page, following Taiga's pagination headers.
+
+        Args:
+            query_params: Dictionary of query parameters to filter tasks (see `list`).
+            page_size: Number of tasks requested per page.
+
+        Yields:
+            Lists of task detail objects, one per page.
+        """
+        endpoint = "/tasks"
+        return self.client.iter_pages(endpoint, params=query_params, page_size=page_size)
+
     def create(
         self, project: int, subject: str, data: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
@@ -56,7 +72,7 @@ class Tasks(Resource):
             Task detail object.
         """
         endpoint = f"/tasks/{task_id}"
-        return self.client.get(endpoint)
+        return self.client.get(endpoint, conditional=True)
 
     def get_by_ref(
         self, ref: int, project: int | str
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, Dict, Any, List, IO, Union
+from typing import TYPE_CHECKING, Optional, Dict, Any, Iterator, List, IO, Union
 
 if TYPE_CHECKING:
     from ..client import TaigaClient
@@ -36,6 +36,21 @@ class UserStories:
         result = self._client.get("/userstories", params=query_params)
         return result if isinstance(result, list) else []
 
+    def list_pages(self, page_size: int = 100, **query_params) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Lists user stories page by page, following Taiga's pagination headers.
+
+        Ref: 18.1. List
+
+        Args:
+            page_size: Number of user stories requested per page.
+            **query_params: Arbitrary keyword arguments passed as query parameters (see `list`).
+
+        Yields:
+            Lists of user story list objects, one per page.
+        """
+        return self._client.iter_pages("/userstories", params=query_params, page_size=page_size)
+
     def list_comments(self, user_story_id: int) -> List[Dict[str, Any]]:
         """
         Lists comments for a specific user story.
@@ -84,7 +99,7 @@ class UserStories:
         Returns:
             A dictionary representing the user story details, or None if not found/error.
         """
-        result = self._client.get(f"/userstories/{user_story_id}")
+        result = self._client.get(f"/userstories/{user_story_id}", conditional=True)
         return result if isinstance(result, dict) else None
 
     def get_by_ref(self, ref: int, project: Union[int, str]) -> Optional[Dict[str, Any]]:
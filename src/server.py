@@ -1,46 +1,185 @@
+import asyncio
+import atexit
+import base64
+import functools
+import inspect
+import json
 import logging
 import os
-from typing import Optional, List, Dict, Any
+import queue
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Optional, AsyncIterable, List, Dict, Any, Tuple
 from dotenv import load_dotenv
+from cachetools import TTLCache
+import httpx
 
 from mcp.server.fastmcp import FastMCP
-from pytaigaclient import TaigaClient  # Import the new client
 # Assuming pytaigaclient also has a base exception
 from pytaigaclient.exceptions import TaigaException, TaigaAuthenticationError
 
+if TYPE_CHECKING:
+    from pytaigaclient import AsyncTaigaClient
+
+try:
+    import uvloop  # Optional, faster event loop (Linux/macOS)
+except ImportError:
+    uvloop = None
+
 # --- Load environment variables ---
 load_dotenv()  # .env 파일이 있으면 로드합니다
 
-# --- Logging Setup ---
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler()  # Log to stderr by default
-    ]
+# --- 환경 변수 설정 (임포트 시 한 번만 읽습니다) ---
+def _env_int(name: str, default: Optional[int] = None) -> Optional[int]:
+    """Read an integer environment variable, treating unset or empty as the default."""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+@dataclass(frozen=True, slots=True)
+class _Cfg:
+    """Environment-derived settings, read once at import."""
+    api_url: str
+    username: Optional[str]
+    password: Optional[str]
+    default_project: Optional[int]
+    log_level: str
+    cache_ttl: int
+    token_path: Path
+
+
+CFG = _Cfg(
+    api_url=os.environ["TAIGA_API_URL"],
+    username=os.environ.get("TAIGA_USERNAME"),
+    password=os.environ.get("TAIGA_PASSWORD"),
+    default_project=_env_int("TAIGA_DEFAULT_PROJECT"),
+    log_level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    cache_ttl=_env_int("TAIGA_CACHE_TTL", 30),
+    token_path=Path(os.environ.get("TAIGA_TOKEN_CACHE", "~/.cache/taiga-mcp/token.json")).expanduser(),
 )
+
+# --- Logging Setup ---
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter using UTC timestamps that reuses the formatted time within the same second."""
+    converter = time.gmtime
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_sec = None
+        self._last_str = ""
+
+    def formatTime(self, record, datefmt=None):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime(datefmt or self.datefmt, self.converter(sec))
+        return self._last_str
+
+
+# Records are enqueued on the calling thread and written to stderr by a
+# background listener, so tool handlers never block on log I/O.
+# This must run before FastMCP() is created: its logging.basicConfig() call
+# is then a no-op instead of adding a second, synchronous stderr handler.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+stream_handler = logging.StreamHandler()  # Log to stderr by default
+stream_handler.setFormatter(_CachedTimeFormatter(
+    fmt='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%dT%H:%M:%SZ'))
+log_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+root_logger = logging.getLogger()
+root_logger.setLevel(getattr(logging, CFG.log_level))
+root_logger.addHandler(QueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 # Quiet down pytaigaclient library logging if needed
 logging.getLogger("pytaigaclient").setLevel(logging.WARNING)
+# httpx logs every request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
-# --- Taiga API 환경 변수 설정 및 클라이언트 초기화 ---
-TAIGA_API_URL = os.environ.get("TAIGA_API_URL")
-TAIGA_USERNAME = os.environ.get("TAIGA_USERNAME")
-TAIGA_PASSWORD = os.environ.get("TAIGA_PASSWORD")
-TAIGA_DEFAULT_PROJECT = os.environ.get("TAIGA_DEFAULT_PROJECT")
-
-# 전역 변수로 Taiga 클라이언트 및 기본 프로젝트 설정
-api = None
-default_project = int(TAIGA_DEFAULT_PROJECT) if TAIGA_DEFAULT_PROJECT is not None else None
-
+# --- Taiga API 클라이언트 초기화 ---
 # 기본 프로젝트 설정 확인
-if TAIGA_DEFAULT_PROJECT:
-    logger.info(f"Default Taiga project set to: {TAIGA_DEFAULT_PROJECT}")
+if CFG.default_project is not None:
+    logger.info("Default Taiga project set to: %s", CFG.default_project)
 else:
     logger.warning("TAIGA_DEFAULT_PROJECT not set")
 
-assert TAIGA_API_URL is not None
-api = TaigaClient(host=TAIGA_API_URL)
+# 프로젝트 메타데이터 캐시 (사람이 드물게 변경하므로 project_id 기준으로 15분간 유지)
+# 기본 프로젝트는 로그인 후 백그라운드에서 미리 불러오고 만료 전에 갱신합니다
+_PROJECT_META_TTL = 900
+_project_cache: TTLCache = TTLCache(maxsize=64, ttl=_PROJECT_META_TTL)
+_status_cache: TTLCache = TTLCache(maxsize=64, ttl=_PROJECT_META_TTL)
+# Keeps background tasks referenced so they are not garbage-collected
+_background_tasks: set = set()
+
+# 단건 조회 도구(get_task, get_issue, get_user_story)의 결과 캐시
+# 에이전트가 같은 항목을 반복 조회하는 경우를 위해 짧게 유지하며, 키는 (도구 이름, 인자)입니다
+_detail_cache: TTLCache = TTLCache(maxsize=1024, ttl=CFG.cache_ttl)
+
+
+def _project_of(result: Any) -> Any:
+    """Return the project ID a cached detail result belongs to, if any."""
+    if isinstance(result, dict) and "user_story" in result:
+        result = result["user_story"]
+    return result.get("project") if isinstance(result, dict) else None
+
+
+def invalidate_project(project_id: int) -> None:
+    """Drop cached data for a project so the next lookup hits the Taiga API."""
+    _project_cache.pop(project_id, None)
+    _status_cache.pop(project_id, None)
+    for key, result in list(_detail_cache.items()):
+        if _project_of(result) == project_id:
+            _detail_cache.pop(key, None)
+
+# 목록 조회 시 한 번에 요청할 페이지 크기
+_PAGE_SIZE = 200
+
+# 일괄 조회 도구(get_*_many)가 동시에 보내는 최대 요청 수
+_BATCH_CONCURRENCY = 16
+
+# 쉼표로 구분된 문자열을 리스트로 변환해야 하는 필터
+_SPLIT_KEYS = frozenset({"tags", "exclude_tags", "members"})
+
+
+def _public_fields(obj: Any) -> Dict[str, Any]:
+    """Return an object's public attributes, leaving out private client state."""
+    return {key: value for key, value in vars(obj).items() if not key.startswith("_")}
+
+
+def _vars_list(items: List[Any]) -> List[Dict[str, Any]]:
+    """Convert a list of API results to dictionaries, if they are objects."""
+    # All items share a type, so check the first one only.
+    if items and hasattr(items[0], "__dict__"):
+        return [_public_fields(item) for item in items]
+    return list(items)
+
+
+async def _collect_pages(pages: AsyncIterable[List[Any]]) -> List[Dict[str, Any]]:
+    """Drain a page iterator into a single list, converting objects to dictionaries if needed."""
+    items: List[Dict[str, Any]] = []
+    async for page in pages:
+        items.extend(_vars_list(page))
+    return items
+
+
+@functools.lru_cache(maxsize=512)
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated filter, memoized since agents repeat the same filters."""
+    return tuple(item.strip() for item in value.split(","))
+
+def _build_params(schema: Tuple[str, ...], values: Dict[str, Any]) -> Dict[str, Any]:
+    """Build query parameters from the schema keys that were given (non-None) values."""
+    return {
+        # httpx sends tuples as repeated query parameters, so the cached tuple is used as-is
+        key: _split_csv(values[key]) if key in _SPLIT_KEYS else values[key]
+        for key in schema
+        if values[key] is not None
+    }
 
 # MCP 서버 설정
 mcp = FastMCP(
@@ -48,35 +187,288 @@ mcp = FastMCP(
     dependencies=["pytaigaclient"]
 )
 
-def login():
+# 프로세스를 재시작할 때마다 다시 로그인하지 않도록 인증 토큰을 CFG.token_path에 보관합니다
+# 만료 직전의 토큰은 재사용하지 않습니다 (초)
+_TOKEN_EXPIRY_MARGIN = 60
+
+
+def _token_expiry(token: str) -> Optional[float]:
+    """Read the 'exp' claim of a JWT auth token (unverified), or None if it has none."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _is_token_record(data: Any) -> bool:
+    """Check that a saved token file has the shape _save_token writes."""
+    if not isinstance(data, dict) or not isinstance(data.get("token"), str):
+        return False
+    exp = data.get("exp")
+    return exp is None or (isinstance(exp, (int, float)) and not isinstance(exp, bool))
+
+
+def _load_token() -> Optional[str]:
+    """Return the saved auth token for the configured server and user, if still valid."""
+    try:
+        data = json.loads(CFG.token_path.read_text())
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("Could not read Taiga auth token %s: %s", CFG.token_path, e)
+        return None
+    except ValueError:
+        data = None
+    if not _is_token_record(data):
+        # A corrupt file would otherwise fail every login until removed by hand
+        logger.warning("Ignoring malformed Taiga auth token file %s", CFG.token_path)
+        _clear_token()
+        return None
+    if data.get("api_url") != CFG.api_url or data.get("username") != CFG.username:
+        return None
+    exp = data.get("exp")
+    if exp is not None and exp <= time.time() + _TOKEN_EXPIRY_MARGIN:
+        return None
+    return data["token"]
+
+
+def _save_token(token: str) -> None:
+    """Save the auth token, readable by the current user only."""
+    data = {
+        "api_url": CFG.api_url,
+        "username": CFG.username,
+        "token": token,
+        "exp": _token_expiry(token),
+    }
+    try:
+        CFG.token_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(CFG.token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.chmod(CFG.token_path, 0o600)  # In case the file already existed
+    except OSError as e:
+        logger.warning("Could not save Taiga auth token to %s: %s", CFG.token_path, e)
+
+
+def _clear_token() -> None:
+    """Forget the saved auth token."""
+    try:
+        CFG.token_path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("Could not remove Taiga auth token %s: %s", CFG.token_path, e)
+
+
+async def login(api: "AsyncTaigaClient", use_saved_token: bool = True):
     if api is None:
         raise TaigaException("Taiga API client is not initialized")
     try:
         # 사용자 이름과 비밀번호가 제공된 경우 로그인 시도
-        if TAIGA_USERNAME and TAIGA_PASSWORD:
-            logger.info(f"Attempting to login with username: {TAIGA_USERNAME}")
-            login_success = api.auth.login(
-                username=TAIGA_USERNAME, 
-                password=TAIGA_PASSWORD
+        if CFG.username and CFG.password:
+            token = _load_token() if use_saved_token else None
+            if token:
+                logger.info("Reusing saved Taiga auth token for user: %s", CFG.username)
+                api.update_token(token)
+                return
+            logger.info("Attempting to login with username: %s", CFG.username)
+            login_success = await api.auth.login(
+                username=CFG.username, 
+                password=CFG.password
             )
             if login_success:
                 logger.info("Successfully logged in to Taiga API")
+                if login_success.get("auth_token"):
+                    _save_token(login_success["auth_token"])
             else:
                 logger.error("Failed to login to Taiga API")
     except TaigaException as e:
-        logger.error(
-            f"Taiga login failed for user '{TAIGA_USERNAME}': {e}", exc_info=False)
+        logger.error("Taiga login failed for user '%s': %s", CFG.username, e)
         raise e
     except Exception as e:
-        logger.error(
-            f"An unexpected error occurred during login for user '{TAIGA_USERNAME}': {e}", exc_info=True)
+        logger.error("An unexpected error occurred during login for user '%s': %s", CFG.username, e,
+                     exc_info=logger.isEnabledFor(logging.DEBUG))
         # Wrap unexpected errors in TaigaException if needed, or re-raise
         raise TaigaException(f"Unexpected login error: {e}")
 
-login()
+# 클라이언트 생성과 로그인은 서버 시작을 막지 않도록 첫 번째 도구 호출 시점까지 지연됩니다
+# (HTTP 클라이언트의 커넥션 풀이 서버의 이벤트 루프에 묶이도록 별도의 asyncio.run 부트스트랩은 사용하지 않습니다)
+_api: Optional["AsyncTaigaClient"] = None
+_api_lock = asyncio.Lock()
+
+
+def _create_api() -> "AsyncTaigaClient":
+    """Build the Taiga client; pytaigaclient's client modules load only here."""
+    from pytaigaclient import AsyncTaigaClient
+
+    # 모든 Taiga 호출이 keep-alive 연결을 재사용하도록 하나의 비동기 HTTP 클라이언트를 공유합니다
+    # (HTTPS 서버에서는 HTTP/2로 동시 요청을 하나의 연결에 다중화합니다)
+    http_client = httpx.AsyncClient(
+        transport=httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        ),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+    )
+    # default_timeout=None leaves the timeouts configured on http_client in effect
+    return AsyncTaigaClient(host=CFG.api_url, session=http_client, default_timeout=None)
+
+
+async def _get_api() -> "AsyncTaigaClient":
+    """Return the logged-in Taiga client, creating it on first use."""
+    global _api
+    if _api is None:
+        async with _api_lock:
+            if _api is None:
+                api = _create_api()
+                try:
+                    await login(api)
+                except BaseException:
+                    await api.aclose()
+                    raise
+                _api = api
+                if CFG.default_project is not None:
+                    task = asyncio.create_task(_keep_project_warm(CFG.default_project))
+                    _background_tasks.add(task)
+                    task.add_done_callback(_background_tasks.discard)
+    return _api
+
+
+async def _relogin(error: TaigaAuthenticationError) -> bool:
+    """
+    Log in again after the server rejected our token (401).
+
+    Returns True if the call should be retried. Concurrent callers that hit
+    the same expired token share a single login.
+    """
+    if error.status_code != 401 or _api is None or not (CFG.username and CFG.password):
+        return False
+    rejected = error.response.request.headers.get("Authorization")
+    async with _api_lock:
+        if f"{_api.token_type} {_api.auth_token}" == rejected:
+            logger.info("Taiga auth token was rejected, logging in again")
+            _clear_token()
+            await login(_api, use_saved_token=False)
+    return True
+
+
+def _taiga_errors(fn):
+    """
+    Decorator providing the shared error handling for MCP tools.
+
+    A rejected auth token triggers one fresh login and retry. Authentication
+    failures and unexpected errors are logged and re-raised as TaigaException;
+    TaigaException from the client is logged and propagated. Log messages
+    name the tool after the decorated function.
+    """
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            try:
+                return await fn(*args, **kwargs)
+            except TaigaAuthenticationError as e:
+                if not await _relogin(e):
+                    raise
+                return await fn(*args, **kwargs)
+        except TaigaAuthenticationError as e:
+            logger.error("Authentication failed in %s: %s", name, e)
+            raise TaigaException(f"Authentication error: {e}")
+        except TaigaException as e:
+            logger.error("Taiga API error in %s: %s", name, e)
+            raise
+        except Exception as e:
+            logger.error("Unexpected error in %s: %s", name, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise TaigaException(f"Error in {name}: {e}")
+    return wrapper
+
+# 진행 중인 조회 요청 (같은 키로 동시에 들어온 호출은 첫 요청의 결과를 함께 기다립니다)
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, factory):
+    """
+    Await factory() once for all concurrent callers with the same key.
+
+    The shared request is shielded, so a cancelled caller does not cancel it
+    for the others; it is forgotten as soon as it finishes.
+    """
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(factory())
+        _inflight[key] = future
+
+        def forget(done: asyncio.Future) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+            if not done.cancelled():
+                done.exception()  # Retrieved even if every caller went away
+
+        future.add_done_callback(forget)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Joining in-flight request for %s", key)
+    return await asyncio.shield(future)
+
+
+def _cached_detail(fn):
+    """
+    Cache a detail tool's result in _detail_cache, keyed by tool name and arguments.
+
+    Concurrent misses for the same key share one call. Only successful results
+    are stored; errors propagate and are retried on the next call.
+    """
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = (fn.__name__, tuple(sorted(bound.arguments.items())))
+        result = _detail_cache.get(key)
+        if result is None:
+            async def load():
+                value = await fn(*args, **kwargs)
+                _detail_cache[key] = value
+                return value
+            result = await _single_flight(key, load)
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Cache hit for %s%s", fn.__name__, key[1])
+        return result
+    return wrapper
+
+# Query parameters accepted by list_projects
+_PROJECT_PARAM_KEYS = (
+    "member", "members", "is_looking_for_people", "is_featured",
+    "is_backlog_activated", "is_kanban_activated", "order_by",
+)
+
+
+async def _fetch_many(tool, ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Run a detail tool for each ID concurrently, returning results in input order.
+
+    The tool's cached layer inside _taiga_errors is called directly: the batch
+    tool's own _taiga_errors logs a failure once and handles re-login for the batch.
+    """
+    fetch = tool.__wrapped__
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+    async def fetch_one(item_id: int) -> Dict[str, Any]:
+        async with semaphore:
+            return await fetch(item_id)
+
+    # Fetch repeated IDs only once
+    unique_ids = list(dict.fromkeys(ids))
+    results = await asyncio.gather(*(fetch_one(item_id) for item_id in unique_ids))
+    by_id = dict(zip(unique_ids, results))
+    return [by_id[item_id] for item_id in ids]
 
 @mcp.tool("list_projects")
-def list_projects(
+@_taiga_errors
+async def list_projects(
     member: Optional[int] = None,
     members: Optional[str] = None,
     is_looking_for_people: Optional[bool] = None,
@@ -100,47 +492,87 @@ def list_projects(
     Returns:
         List of projects matching the criteria
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
-    # Prepare filters
-    params = {}
-    
-    # Add all provided filters to the params dictionary
-    if member is not None:
-        params["member"] = member
-    if members is not None:
-        # Convert comma-separated values to list
-        params["members"] = members.split(",")
-    if is_looking_for_people is not None:
-        params["is_looking_for_people"] = is_looking_for_people
-    if is_featured is not None:
-        params["is_featured"] = is_featured
-    if is_backlog_activated is not None:
-        params["is_backlog_activated"] = is_backlog_activated
-    if is_kanban_activated is not None:
-        params["is_kanban_activated"] = is_kanban_activated
-    if order_by is not None:
-        params["order_by"] = order_by
+    # Prepare filters from every provided (non-None) argument
+    params = _build_params(_PROJECT_PARAM_KEYS, locals())
     
-    try:
-        # Projects.list() expects key-value arguments, so we pass params as **kwargs
-        projects = api.projects.list(**params)
-        logger.info(f"Fetched {len(projects)} projects from Taiga")
-        # Convert project objects to dictionaries if needed
-        return [project.__dict__ if hasattr(project, "__dict__") else project for project in projects]
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch projects: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching projects: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching projects: {e}")
+    # Projects.list() expects key-value arguments, so we pass params as **kwargs
+    projects = await api.projects.list(**params)
+    logger.info("Fetched %d projects from Taiga", len(projects))
+    # Convert project objects to dictionaries if needed
+    return _vars_list(projects)
+
+async def _load_project_meta(api: "AsyncTaigaClient", project_id: int, refresh: bool = False) -> Tuple[Any, Any]:
+    """
+    Return a project's details and user story statuses from the metadata caches,
+    fetching whatever is missing (or both, if refresh is set).
+    """
+    if refresh:
+        project = user_story_statuses = None
+    else:
+        project = _project_cache.get(project_id)
+        user_story_statuses = _status_cache.get(project_id)
+    # The two requests are independent, so cache misses run concurrently.
+    if project is None and user_story_statuses is None:
+        # Let both calls finish so a failure is attributed to the call that
+        # raised, and the half that succeeded is still cached.
+        project, user_story_statuses = await asyncio.gather(
+            api.projects.get(project_id),
+            api.userstory_statuses.list({"project": project_id}),
+            return_exceptions=True)
+        failure = None
+        for label, outcome in (("project", project), ("user story statuses", user_story_statuses)):
+            if isinstance(outcome, BaseException):
+                logger.error("Failed to fetch %s for project %s: %s", label, project_id, outcome)
+                failure = failure or outcome
+        if not isinstance(project, BaseException):
+            _project_cache[project_id] = project
+        if not isinstance(user_story_statuses, BaseException):
+            _status_cache[project_id] = user_story_statuses
+        if failure is not None:
+            raise failure
+    elif project is None:
+        project = await api.projects.get(project_id)
+        _project_cache[project_id] = project
+    elif user_story_statuses is None:
+        user_story_statuses = await api.userstory_statuses.list({"project": project_id})
+        _status_cache[project_id] = user_story_statuses
+    return project, user_story_statuses
+
+
+# 미리 불러오기에 실패하면 다음 갱신 주기까지 기다리지 않고 이 간격(초) 후에 다시 시도합니다
+_PRELOAD_RETRY_DELAY = 30
+
+
+async def _keep_project_warm(project_id: int) -> None:
+    """Reload a project's metadata shortly before it expires, for the life of the server."""
+    # Same key as get_project_info, so a call overlapping the preload joins it
+    key = ("get_project_info", project_id)
+
+    def reload():
+        return _load_project_meta(_api, project_id, refresh=True)
+
+    while True:
+        try:
+            try:
+                await _single_flight(key, reload)
+            except TaigaAuthenticationError as e:
+                # A saved token rejected after a restart; log in again like the tools do
+                if not await _relogin(e):
+                    raise
+                await _single_flight(key, reload)
+            logger.info("Preloaded metadata for project %s", project_id)
+            delay = _PROJECT_META_TTL * 0.8
+        except Exception as e:
+            logger.warning("Could not preload metadata for project %s: %s", project_id, e)
+            delay = _PRELOAD_RETRY_DELAY
+        await asyncio.sleep(delay)
+
 
 @mcp.tool("get_project_info")
-def get_project_info(project_id: Optional[int] = None) -> Dict[str, Any]:
+@_taiga_errors
+async def get_project_info(project_id: Optional[int] = None) -> Dict[str, Any]:
     """
     Retrieve comprehensive information about a Taiga project including status categories.
     
@@ -150,50 +582,47 @@ def get_project_info(project_id: Optional[int] = None) -> Dict[str, Any]:
     Returns:
         Dictionary containing project details, user story statuses.
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
     # Use default project if not specified
     if project_id is None:
-        project_id = default_project
+        project_id = CFG.default_project
         
     if project_id is None:
         raise TaigaException("No project ID specified and no default project configured")
     
-    try:
-        # Fetch project details
-        project = api.projects.get(project_id)
-        project_name = project if hasattr(project, 'name') else None
-        logger.info(f"Retrieved information for project: {project_name}")
-        
-        # Fetch user story statuses
-        user_story_statuses = api.userstory_statuses.list({"project": project_id})
-        logger.info(f"Retrieved {len(user_story_statuses)} user story statuses")
-        
-        # Fetch task statuses
-        # task_statuses = api.tasks.list(project=project_id)
-        # logger.info(f"Retrieved {len(task_statuses)} task statuses")
-        
-        # Prepare the response
-        result = {
-            "project": project.__dict__ if hasattr(project, "__dict__") else project,
-            "user_story_statuses": [status.__dict__ if hasattr(status, "__dict__") else status for status in user_story_statuses]
-        }
-        
-        return result
+    # Fetch project details and user story statuses (cached, shared by concurrent calls)
+    project, user_story_statuses = await _single_flight(
+        ("get_project_info", project_id), lambda: _load_project_meta(api, project_id))
+
+    project_name = project if hasattr(project, 'name') else None
+    logger.info("Retrieved information for project: %s", project_name)
+    logger.info("Retrieved %d user story statuses", len(user_story_statuses))
     
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed while retrieving project info: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to retrieve project information: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while retrieving project information: {e}", exc_info=True)
-        raise TaigaException(f"Error retrieving project information: {e}")
+    # Fetch task statuses
+    # task_statuses = api.tasks.list(project=project_id)
+    # logger.info("Retrieved %d task statuses", len(task_statuses))
+    
+    # Prepare the response
+    result = {
+        "project": project.__dict__ if hasattr(project, "__dict__") else project,
+        "user_story_statuses": _vars_list(user_story_statuses)
+    }
+    
+    return result
+
+# Query parameters accepted by list_user_stories
+_USER_STORY_PARAM_KEYS = (
+    "project", "milestone", "milestone__isnull", "status",
+    "status__is_archived", "tags", "watchers", "assigned_to", "epic", "role",
+    "status__is_closed", "exclude_status", "exclude_tags",
+    "exclude_assigned_to", "exclude_role", "exclude_epic",
+)
+
 
 @mcp.tool("list_user_stories")
-def list_user_stories(
+@_taiga_errors
+async def list_user_stories(
     project: Optional[int] = None,
     milestone: Optional[int] = None,
     milestone__isnull: Optional[bool] = None,
@@ -235,69 +664,33 @@ def list_user_stories(
     Returns:
         List of user stories matching the criteria
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
     # Use default project if not specified
     if project is None:
-        project = default_project
-    
-    # Prepare filters
-    params = {}
-    
-    # Add all provided filters
-    if project is not None:
-        params["project"] = project
-    if milestone is not None:
-        params["milestone"] = milestone
-    if milestone__isnull is not None:
-        params["milestone__isnull"] = milestone__isnull
-    if status is not None:
-        params["status"] = status
-    if status__is_archived is not None:
-        params["status__is_archived"] = status__is_archived
-    if tags is not None:
-        params["tags"] = tags.split(",")
-    if watchers is not None:
-        params["watchers"] = watchers
-    if assigned_to is not None:
-        params["assigned_to"] = assigned_to
-    if epic is not None:
-        params["epic"] = epic
-    if role is not None:
-        params["role"] = role
-    if status__is_closed is not None:
-        params["status__is_closed"] = status__is_closed
-    if exclude_status is not None:
-        params["exclude_status"] = exclude_status
-    if exclude_tags is not None:
-        params["exclude_tags"] = exclude_tags.split(",")
-    if exclude_assigned_to is not None:
-        params["exclude_assigned_to"] = exclude_assigned_to
-    if exclude_role is not None:
-        params["exclude_role"] = exclude_role
-    if exclude_epic is not None:
-        params["exclude_epic"] = exclude_epic
+        project = CFG.default_project
     
-    try:
-        # Use the TaigaClient to fetch user stories with the filters
-        user_stories = api.user_stories.list(**params)
-        logger.info(f"Fetched {len(user_stories)} user stories from Taiga")
-        # Convert user story objects to dictionaries if needed
-        return [story.__dict__ if hasattr(story, "__dict__") else story for story in user_stories]
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch user stories: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching user stories: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching user stories: {e}")
+    # Prepare filters from every provided (non-None) argument
+    params = _build_params(_USER_STORY_PARAM_KEYS, locals())
+    
+    # Use the AsyncTaigaClient to fetch user stories with the filters, one page at a time
+    pages = api.user_stories.list_pages(page_size=_PAGE_SIZE, **params)
+    user_stories = await _collect_pages(pages)
+    logger.info("Fetched %d user stories from Taiga", len(user_stories))
+    return user_stories
+
+
+def _discard(task: "asyncio.Task[Any]") -> None:
+    """Cancel a speculative request whose result is no longer needed."""
+    task.cancel()
+    # If it already finished with an error, retrieve it so asyncio doesn't warn
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
 
 @mcp.tool("get_user_story")
-def get_user_story(user_story_id: int) -> Dict[str, Any]:
+@_taiga_errors
+@_cached_detail
+async def get_user_story(user_story_id: int) -> Dict[str, Any]:
     """
     Retrieve detailed information for a user story by its ID.
     
@@ -307,45 +700,59 @@ def get_user_story(user_story_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary containing user story details and comments
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
         
+    # Get user story by ID, speculatively fetching its comments in parallel
+    comments_task = asyncio.create_task(api.user_stories.list_comments(user_story_id))
     try:
-        # Get user story by ID
-        user_story = api.user_stories.get(user_story_id)
-        if user_story is None:
-            raise TaigaException(f"User story with ID {user_story_id} not found")
+        user_story = await api.user_stories.get(user_story_id)
+    except BaseException:
+        _discard(comments_task)
+        raise
+    if user_story is None:
+        _discard(comments_task)
+        raise TaigaException(f"User story with ID {user_story_id} not found")
 
-        # Check if user story has comments, and fetch them if it does
-        total_comments = user_story.get("total_comments", 0)
-        logger.debug(f"User story {user_story_id} has {total_comments} comments")
+    # Only wait for the comments if the user story actually has some
+    total_comments = user_story.get("total_comments", 0)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("User story %s has %s comments", user_story_id, total_comments)
 
-        comments = []
-        if total_comments > 0:
-            comments = api.user_stories.list_comments(user_story_id)
-            logger.debug(f"Retrieved {len(comments)} comments for user story {user_story_id}")
+    comments = []
+    if total_comments > 0:
+        comments = await comments_task
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Retrieved %d comments for user story %s", len(comments), user_story_id)
+    else:
+        _discard(comments_task)
 
-        logger.info(f"Retrieved user story: ID {user_story_id}")
-        
-        # Create result dictionary with both story data and comments
-        result = {
-            "user_story": user_story,
-            "comments": comments
-        }
+    logger.info("Retrieved user story: ID %s", user_story_id)
+    
+    # Create result dictionary with both story data and comments
+    result = {
+        "user_story": user_story,
+        "comments": comments
+    }
 
-        return result
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch user story: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching user story: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching user story: {e}")
+    return result
+
+@mcp.tool("get_user_stories_many")
+@_taiga_errors
+async def get_user_stories_many(user_story_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Retrieve detailed information for several user stories by their IDs in one call.
+    
+    Args:
+        user_story_ids: IDs of the user stories to retrieve
+    
+    Returns:
+        List of dictionaries containing user story details and comments, in the order requested
+    """
+    return await _fetch_many(get_user_story, user_story_ids)
 
 @mcp.tool("get_user_story_by_ref")
-def get_user_story_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
+@_taiga_errors
+async def get_user_story_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
     """
     Retrieve detailed information for a user story by its reference number and project.
     
@@ -356,36 +763,34 @@ def get_user_story_by_ref(ref: int, project: Optional[int] = None) -> Dict[str,
     Returns:
         Dictionary containing user story details
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
         
     if project is None:
-        if default_project is None:
+        if CFG.default_project is None:
             raise TaigaException("No project ID specified and no default project configured")
-        project = default_project
+        project = CFG.default_project
 
-    try:
-        # Get user story by reference number and project ID
-        user_story = api.user_stories.get_by_ref(ref=ref, project=project)
-        if user_story is None:
-            raise TaigaException(f"User story with reference #{ref} not found in project {project}")
+    # Get user story by reference number and project ID
+    user_story = await api.user_stories.get_by_ref(ref=ref, project=project)
+    if user_story is None:
+        raise TaigaException(f"User story with reference #{ref} not found in project {project}")
+
+    logger.info("Retrieved user story: Reference #%s in project %s", ref, project)
+    
+    return user_story
 
-        logger.info(f"Retrieved user story: Reference #{ref} in project {project}")
-        
-        return user_story
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch user story by reference: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching user story by reference: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching user story by reference: {e}")
+
+# Query parameters accepted by list_tasks
+_TASK_PARAM_KEYS = (
+    "project", "milestone", "status", "assigned_to", "user_story", "tags",
+    "role", "owner", "status__is_closed", "watchers", "exclude_status",
+    "exclude_tags", "exclude_role", "exclude_owner", "exclude_assigned_to",
+)
 
 
 @mcp.tool("list_tasks")
-def list_tasks(
+@_taiga_errors
+async def list_tasks(
     project: Optional[int] = None,
     milestone: Optional[int] = None,
     status: Optional[int] = None,
@@ -425,66 +830,25 @@ def list_tasks(
     Returns:
         List of tasks matching the criteria
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
     # Use default project if not specified
     if project is None:
-        project = default_project
-    
-    # Prepare filters
-    params = {}
-    
-    # Add all provided filters to the params dictionary
-    if project is not None:
-        params["project"] = project
-    if milestone is not None:
-        params["milestone"] = milestone
-    if status is not None:
-        params["status"] = status
-    if assigned_to is not None:
-        params["assigned_to"] = assigned_to
-    if user_story is not None:
-        params["user_story"] = user_story
-    if tags is not None:
-        params["tags"] = tags.split(",")
-    if role is not None:
-        params["role"] = role
-    if owner is not None:
-        params["owner"] = owner
-    if status__is_closed is not None:
-        params["status__is_closed"] = status__is_closed
-    if watchers is not None:
-        params["watchers"] = watchers
-    if exclude_status is not None:
-        params["exclude_status"] = exclude_status
-    if exclude_tags is not None:
-        params["exclude_tags"] = exclude_tags.split(",")
-    if exclude_role is not None:
-        params["exclude_role"] = exclude_role
-    if exclude_owner is not None:
-        params["exclude_owner"] = exclude_owner
-    if exclude_assigned_to is not None:
-        params["exclude_assigned_to"] = exclude_assigned_to
+        project = CFG.default_project
     
-    try:
-        # Tasks.list() accepts a single query_params dictionary
-        tasks = api.tasks.list(query_params=params)
-        logger.info(f"Fetched {len(tasks)} tasks from Taiga")
-        # Convert task objects to dictionaries if needed
-        return [task.__dict__ if hasattr(task, "__dict__") else task for task in tasks]
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch tasks: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching tasks: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching tasks: {e}")
+    # Prepare filters from every provided (non-None) argument
+    params = _build_params(_TASK_PARAM_KEYS, locals())
+    
+    # AsyncTasks.list_pages() accepts a single query_params dictionary
+    pages = api.tasks.list_pages(query_params=params, page_size=_PAGE_SIZE)
+    tasks = await _collect_pages(pages)
+    logger.info("Fetched %d tasks from Taiga", len(tasks))
+    return tasks
 
 @mcp.tool("get_task")
-def get_task(task_id: int) -> Dict[str, Any]:
+@_taiga_errors
+@_cached_detail
+async def get_task(task_id: int) -> Dict[str, Any]:
     """
     Retrieve detailed information for a task by its ID.
     
@@ -494,27 +858,31 @@ def get_task(task_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary containing task details
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
-    try:
-        # Get task by ID
-        task = api.tasks.get(task_id)
-        logger.info(f"Retrieved task: {task_id}")
-        # Convert task object to dictionary
-        return task.__dict__ if hasattr(task, "__dict__") else task
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch task {task_id}: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching task {task_id}: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching task: {e}")
+    # Get task by ID
+    task = await api.tasks.get(task_id)
+    logger.info("Retrieved task: %s", task_id)
+    # Convert task object to dictionary
+    return task.__dict__ if hasattr(task, "__dict__") else task
+
+@mcp.tool("get_tasks_many")
+@_taiga_errors
+async def get_tasks_many(task_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Retrieve detailed information for several tasks by their IDs in one call.
+    
+    Args:
+        task_ids: IDs of the tasks to retrieve
+        
+    Returns:
+        List of dictionaries containing task details, in the order requested
+    """
+    return await _fetch_many(get_task, task_ids)
 
 @mcp.tool("get_task_by_ref")
-def get_task_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
+@_taiga_errors
+async def get_task_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
     """
     Retrieve detailed information for a task by its reference number and project.
     
@@ -525,35 +893,34 @@ def get_task_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
     Returns:
         Dictionary containing task details
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
         
     if project is None:
-        if default_project is None:
+        if CFG.default_project is None:
             raise TaigaException("No project ID specified and no default project configured")
-        project = default_project
+        project = CFG.default_project
 
-    try:
-        # Get task by reference number and project ID
-        task = api.tasks.get_by_ref(ref=ref, project=project)
-        if task is None:
-            raise TaigaException(f"Task with reference #{ref} not found in project {project}")
+    # Get task by reference number and project ID
+    task = await api.tasks.get_by_ref(ref=ref, project=project)
+    if task is None:
+        raise TaigaException(f"Task with reference #{ref} not found in project {project}")
+
+    logger.info("Retrieved task: Reference #%s in project %s", ref, project)
+    
+    return task.__dict__ if hasattr(task, "__dict__") else task
+
+# Query parameters accepted by list_issues
+_ISSUE_PARAM_KEYS = (
+    "project", "status", "severity", "priority", "owner", "assigned_to",
+    "tags", "type", "role", "watchers", "status__is_closed", "exclude_status",
+    "exclude_severity", "exclude_priority", "exclude_owner",
+    "exclude_assigned_to", "exclude_tags", "exclude_type", "exclude_role",
+)
 
-        logger.info(f"Retrieved task: Reference #{ref} in project {project}")
-        
-        return task.__dict__ if hasattr(task, "__dict__") else task
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch task by reference: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching task by reference: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching task by reference: {e}")
 
 @mcp.tool("list_issues")
-def list_issues(
+@_taiga_errors
+async def list_issues(
     project: Optional[int] = None,
     status: Optional[int] = None,
     severity: Optional[int] = None,
@@ -601,74 +968,26 @@ def list_issues(
     Returns:
         List of issues matching the criteria
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
     # Use default project if not specified
     if project is None:
-        project = default_project
-    
-    # Prepare filters
-    params = {}
-    
-    # Add all provided filters to the params dictionary
-    if project is not None:
-        params["project"] = project
-    if status is not None:
-        params["status"] = status
-    if severity is not None:
-        params["severity"] = severity
-    if priority is not None:
-        params["priority"] = priority
-    if owner is not None:
-        params["owner"] = owner
-    if assigned_to is not None:
-        params["assigned_to"] = assigned_to
-    if tags is not None:
-        params["tags"] = tags.split(",")
-    if type is not None:
-        params["type"] = type
-    if role is not None:
-        params["role"] = role
-    if watchers is not None:
-        params["watchers"] = watchers
-    if status__is_closed is not None:
-        params["status__is_closed"] = status__is_closed
-    if exclude_status is not None:
-        params["exclude_status"] = exclude_status
-    if exclude_severity is not None:
-        params["exclude_severity"] = exclude_severity
-    if exclude_priority is not None:
-        params["exclude_priority"] = exclude_priority
-    if exclude_owner is not None:
-        params["exclude_owner"] = exclude_owner
-    if exclude_assigned_to is not None:
-        params["exclude_assigned_to"] = exclude_assigned_to
-    if exclude_tags is not None:
-        params["exclude_tags"] = exclude_tags.split(",")
-    if exclude_type is not None:
-        params["exclude_type"] = exclude_type
-    if exclude_role is not None:
-        params["exclude_role"] = exclude_role
+        project = CFG.default_project
     
-    try:
-        # Issues.list() accepts a single query_params dictionary
-        issues = api.issues.list(query_params=params)
-        logger.info(f"Fetched {len(issues)} issues from Taiga")
-        # Convert issue objects to dictionaries if needed
-        return [issue.__dict__ if hasattr(issue, "__dict__") else issue for issue in issues]
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch issues: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching issues: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching issues: {e}")
+    # Prepare filters from every provided (non-None) argument
+    params = _build_params(_ISSUE_PARAM_KEYS, locals())
+    
+    # AsyncIssues.list_pages() accepts a single query_params dictionary
+    pages = api.issues.list_pages(query_params=params, page_size=_PAGE_SIZE)
+    issues = await _collect_pages(pages)
+    logger.info("Fetched %d issues from Taiga", len(issues))
+    # Convert issue objects to dictionaries if needed
+    return issues
 
 @mcp.tool("get_issue")
-def get_issue(issue_id: int) -> Dict[str, Any]:
+@_taiga_errors
+@_cached_detail
+async def get_issue(issue_id: int) -> Dict[str, Any]:
     """
     Retrieve detailed information for an issue by its ID.
     
@@ -678,27 +997,31 @@ def get_issue(issue_id: int) -> Dict[str, Any]:
     Returns:
         Dictionary containing issue details
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
     
-    try:
-        # Get issue by ID
-        issue = api.issues.get(issue_id)
-        logger.info(f"Retrieved issue: {issue_id}")
-        # Convert issue object to dictionary
-        return issue.__dict__ if hasattr(issue, "__dict__") else issue
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch issue {issue_id}: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching issue {issue_id}: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching issue: {e}")
+    # Get issue by ID
+    issue = await api.issues.get(issue_id)
+    logger.info("Retrieved issue: %s", issue_id)
+    # Convert issue object to dictionary
+    return issue.__dict__ if hasattr(issue, "__dict__") else issue
+
+@mcp.tool("get_issues_many")
+@_taiga_errors
+async def get_issues_many(issue_ids: List[int]) -> List[Dict[str, Any]]:
+    """
+    Retrieve detailed information for several issues by their IDs in one call.
+    
+    Args:
+        issue_ids: IDs of the issues to retrieve
+        
+    Returns:
+        List of dictionaries containing issue details, in the order requested
+    """
+    return await _fetch_many(get_issue, issue_ids)
 
 @mcp.tool("get_issue_by_ref")
-def get_issue_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
+@_taiga_errors
+async def get_issue_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
     """
     Retrieve detailed information for an issue by its reference number and project.
     
@@ -709,33 +1032,27 @@ def get_issue_by_ref(ref: int, project: Optional[int] = None) -> Dict[str, Any]:
     Returns:
         Dictionary containing issue details
     """
-    if api is None:
-        raise TaigaException("Taiga API client is not initialized")
+    api = await _get_api()
         
     if project is None:
-        if default_project is None:
+        if CFG.default_project is None:
             raise TaigaException("No project ID specified and no default project configured")
-        project = default_project
+        project = CFG.default_project
 
-    try:
-        # Get issue by reference number and project ID
-        issue = api.issues.get_by_ref(ref=ref, project=project)
-        if issue is None:
-            raise TaigaException(f"Issue with reference #{ref} not found in project {project}")
+    # Get issue by reference number and project ID
+    issue = await api.issues.get_by_ref(ref=ref, project=project)
+    if issue is None:
+        raise TaigaException(f"Issue with reference #{ref} not found in project {project}")
 
-        logger.info(f"Retrieved issue: Reference #{ref} in project {project}")
-        
-        return issue.__dict__ if hasattr(issue, "__dict__") else issue
-    except TaigaAuthenticationError as e:
-        logger.error(f"Authentication failed: {e}")
-        raise TaigaException(f"Authentication error: {e}")
-    except TaigaException as e:
-        logger.error(f"Failed to fetch issue by reference: {e}")
-        raise e
-    except Exception as e:
-        logger.error(f"Unexpected error while fetching issue by reference: {e}", exc_info=True)
-        raise TaigaException(f"Error fetching issue by reference: {e}")
+    logger.info("Retrieved issue: Reference #%s in project %s", ref, project)
+    
+    return issue.__dict__ if hasattr(issue, "__dict__") else issue
 
 # --- Run the server ---
 if __name__ == "__main__":
+    # mcp.run() starts its loop via anyio/asyncio, which honors the loop policy.
+    # Set only here so importing this module leaves asyncio untouched; loop
+    # policies are deprecated from Python 3.14, which keeps the default loop.
+    if uvloop is not None and sys.version_info < (3, 14):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     mcp.run()
\ No newline at end of file
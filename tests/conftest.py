@@ -0,0 +1,6 @@
+import os
+
+# server.py reads its settings at import time; point it at a fake Taiga
+# before any test module imports it.
+os.environ["TAIGA_API_URL"] = "http://taiga.test"
+os.environ["TAIGA_DEFAULT_PROJECT"] = ""
@@ -0,0 +1,130 @@
+"""Tests for AsyncTaigaClient pagination and conditional GETs."""
+
+import asyncio
+import gc
+
+import httpx
+import pytest
+
+from pytaigaclient.async_client import AsyncTaigaClient
+from pytaigaclient.exceptions import TaigaServerError
+
+
+def make_client(handler) -> AsyncTaigaClient:
+    session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncTaigaClient("http://taiga.test", auth_token="token", session=session)
+
+
+def page_response(page: int, last_page: int, per_page: int = 2, counted: bool = True) -> httpx.Response:
+    headers = {"x-paginated-by": str(per_page)}
+    if counted:
+        headers["x-pagination-count"] = str(last_page * per_page)
+    if page < last_page:
+        headers["x-pagination-next"] = f"http://taiga.test/api/v1/items?page={page + 1}"
+    items = [{"id": (page - 1) * per_page + i} for i in range(per_page)]
+    return httpx.Response(200, json=items, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_yields_concurrent_pages_in_order():
+    requested = []
+
+    async def handler(request):
+        page = int(request.url.params["page"])
+        requested.append(page)
+        # Later pages answer first, so ordering must come from iter_pages itself
+        await asyncio.sleep(0.01 * (6 - page))
+        return page_response(page, last_page=5)
+
+    client = make_client(handler)
+    pages = [items async for items in client.iter_pages("/items", {"project": 1}, page_size=2)]
+
+    assert [item["id"] for items in pages for item in items] == list(range(10))
+    assert sorted(requested) == [1, 2, 3, 4, 5]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_follows_next_header_without_count():
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params["page"])
+        requested.append(page)
+        return page_response(page, last_page=3, counted=False)
+
+    client = make_client(handler)
+    pages = [items async for items in client.iter_pages("/items", page_size=2)]
+
+    assert requested == [1, 2, 3]
+    assert [item["id"] for items in pages for item in items] == list(range(6))
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_pages_failure_leaves_no_pending_tasks():
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _loop, context: unhandled.append(context))
+
+    async def handler(request):
+        page = int(request.url.params["page"])
+        if page == 3:
+            await asyncio.sleep(0.02)
+            return httpx.Response(500, json={"_error_message": "boom"})
+        if page in (4, 5):
+            # Fail before page 3 does, so their errors are never awaited
+            return httpx.Response(500, json={"_error_message": "boom"})
+        if page == 6:
+            await asyncio.sleep(10)  # Still running when page 3 fails
+        return page_response(page, last_page=6)
+
+    client = make_client(handler)
+    received = []
+    with pytest.raises(TaigaServerError):
+        async for items in client.iter_pages("/items", page_size=2):
+            received.append(items)
+
+    await asyncio.sleep(0)  # Let cancelled tasks finish
+    assert len(received) == 2
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    gc.collect()
+    await asyncio.sleep(0)
+    assert unhandled == []
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_cached_body_on_304():
+    sent_etags = []
+
+    def handler(request):
+        sent_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"id": 7, "subject": "Task"}, headers={"ETag": '"v1"'})
+
+    client = make_client(handler)
+    first = await client.get("/tasks/7", conditional=True)
+    second = await client.get("/tasks/7", conditional=True)
+
+    assert sent_etags == [None, '"v1"']
+    assert second == first == {"id": 7, "subject": "Task"}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_replaces_changed_body():
+    versions = iter([("v1", "Old"), ("v2", "New")])
+
+    def handler(request):
+        etag, subject = next(versions)
+        return httpx.Response(200, json={"subject": subject}, headers={"ETag": f'"{etag}"'})
+
+    client = make_client(handler)
+    await client.get("/tasks/7", conditional=True)
+
+    assert await client.get("/tasks/7", conditional=True) == {"subject": "New"}
+    assert client._etag_cache["http://taiga.test/api/v1/tasks/7"][0] == '"v2"'
+    await client.aclose()
@@ -0,0 +1,303 @@
+"""Tests for the server's request sharing and re-login handling."""
+
+import asyncio
+import base64
+import dataclasses
+import json
+import logging
+import stat
+import time
+
+import httpx
+import pytest
+import pytest_asyncio
+
+import server
+from pytaigaclient.exceptions import TaigaException
+
+
+class FakeTaiga:
+    """A Taiga API stand-in that counts requests and accepts only its current token."""
+
+    def __init__(self):
+        self.requests = []
+        self.auth_headers = []  # (path, Authorization header) per request
+        self.logins = 0
+        self.token = None
+        self.fail_next = set()  # Paths answered with a 500 once
+        self.delay = 0.02
+        self.active = 0
+        self.max_active = 0  # Most requests seen in flight at once
+
+    def hits(self, path: str) -> int:
+        return sum(1 for method, seen in self.requests if seen == path)
+
+    def expire_token(self) -> None:
+        self.token = None
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path.removeprefix("/api/v1")
+        self.requests.append((request.method, path))
+        self.auth_headers.append((path, request.headers.get("Authorization")))
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if path == "/auth":
+            self.logins += 1
+            self.token = f"token-{self.logins}"
+            return httpx.Response(200, json={"auth_token": self.token})
+        if self.token is None or request.headers.get("Authorization") != f"Bearer {self.token}":
+            return httpx.Response(401, json={"_error_message": "Invalid token"})
+        if path in self.fail_next:
+            self.fail_next.discard(path)
+            return httpx.Response(500, json={"_error_message": "Server error"})
+        if path.startswith("/tasks/"):
+            return httpx.Response(200, json={"id": int(path.rsplit("/", 1)[1]), "project": 1})
+        if path == "/projects":
+            return httpx.Response(200, json=[{"id": 1}])
+        if path == "/projects/1":
+            return httpx.Response(200, json={"id": 1, "name": "Project"})
+        if path == "/userstory-statuses":
+            return httpx.Response(200, json=[{"id": 10, "name": "New"}])
+        return httpx.Response(404, json={"_error_message": "Not found"})
+
+
+def make_jwt(claims: dict) -> str:
+    """Build an unsigned JWT-shaped token carrying the given claims."""
+    def encode(part: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(part).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'none'})}.{encode(claims)}.signature"
+
+
+@pytest_asyncio.fixture
+async def taiga(monkeypatch, tmp_path):
+    """Route the server's HTTP client to a FakeTaiga and reset the server's module state."""
+    fake = FakeTaiga()
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", lambda **kwargs: httpx.MockTransport(fake.handle))
+    monkeypatch.setattr(server, "CFG", dataclasses.replace(
+        server.CFG, username="user", password="secret", default_project=None,
+        token_path=tmp_path / "token.json"))
+    monkeypatch.setattr(server, "_api", None)
+    monkeypatch.setattr(server, "_api_lock", asyncio.Lock())
+    for cache in (server._detail_cache, server._project_cache, server._status_cache, server._inflight):
+        cache.clear()
+    yield fake
+    for task in list(server._background_tasks):
+        task.cancel()
+    await asyncio.gather(*server._background_tasks, return_exceptions=True)
+    if server._api is not None:
+        await server._api.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request(taiga):
+    results = await asyncio.gather(*(server.get_task(42) for _ in range(5)))
+
+    assert results == [{"id": 42, "project": 1}] * 5
+    assert taiga.hits("/tasks/42") == 1
+    assert server._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_request(taiga):
+    await server._get_api()
+    first = asyncio.create_task(server.get_task(42))
+    await asyncio.sleep(taiga.delay / 2)  # The request is now in flight
+    second = asyncio.create_task(server.get_task(42))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == {"id": 42, "project": 1}
+    assert first.cancelled()
+    assert await server.get_task(42) == {"id": 42, "project": 1}  # Served from the cache
+    assert taiga.hits("/tasks/42") == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_shared_request_is_forgotten_and_retried(taiga):
+    await server._get_api()
+    taiga.fail_next.add("/tasks/42")
+
+    results = await asyncio.gather(*(server.get_task(42) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, TaigaException) for result in results)
+    assert taiga.hits("/tasks/42") == 1
+    assert server._inflight == {}
+    assert await server.get_task(42) == {"id": 42, "project": 1}
+    assert taiga.hits("/tasks/42") == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_401s_share_one_login(taiga):
+    await server._get_api()
+    assert taiga.logins == 1
+    taiga.expire_token()
+
+    results = await asyncio.gather(*(server.get_task(task_id) for task_id in (1, 2, 3)))
+
+    assert [result["id"] for result in results] == [1, 2, 3]
+    assert taiga.logins == 2
+    assert taiga.hits("/auth") == 2
+
+
+@pytest.mark.asyncio
+async def test_requests_during_relogin_keep_the_current_token(taiga):
+    api = await server._get_api()
+    taiga.delay = 0.05
+    relogin = asyncio.create_task(server.login(api, use_saved_token=False))
+    await asyncio.sleep(taiga.delay / 2)  # The /auth POST is now in flight
+
+    assert await server.list_projects() == [{"id": 1}]
+    await relogin
+    assert ("/auth", None) in taiga.auth_headers
+    assert ("/projects", "Bearer token-1") in taiga.auth_headers
+
+
+@pytest.mark.asyncio
+async def test_preload_logs_in_again_when_the_saved_token_is_rejected(taiga, monkeypatch):
+    monkeypatch.setattr(server, "CFG", dataclasses.replace(server.CFG, default_project=1))
+    server._save_token("stale-token")  # Saved before a restart, no longer accepted
+
+    await server._get_api()
+    for _ in range(50):
+        if 1 in server._project_cache:
+            break
+        await asyncio.sleep(0.01)
+
+    assert server._project_cache[1] == {"id": 1, "name": "Project"}
+    assert taiga.logins == 1
+
+
+@pytest.mark.asyncio
+async def test_first_get_project_info_joins_the_preload(taiga, monkeypatch):
+    monkeypatch.setattr(server, "CFG", dataclasses.replace(server.CFG, default_project=1))
+
+    # The first tool call starts the preload from _get_api() and overlaps it
+    info = await server.get_project_info()
+    await asyncio.sleep(taiga.delay * 2)  # Let the preload finish if it fetched on its own
+
+    assert info["project"] == {"id": 1, "name": "Project"}
+    assert taiga.hits("/projects/1") == 1
+    assert taiga.hits("/userstory-statuses") == 1
+
+
+def test_saved_token_is_private_and_reloaded(taiga, monkeypatch, tmp_path):
+    token_path = tmp_path / "cache" / "token.json"
+    monkeypatch.setattr(server, "CFG", dataclasses.replace(server.CFG, token_path=token_path))
+    token = make_jwt({"exp": time.time() + 3600})
+
+    server._save_token(token)
+
+    assert stat.S_IMODE(token_path.stat().st_mode) == 0o600
+    assert stat.S_IMODE(token_path.parent.stat().st_mode) == 0o700
+    assert server._load_token() == token
+
+
+@pytest.mark.parametrize("field, value", [
+    ("api_url", "http://other-taiga.test"),
+    ("username", "someone-else"),
+])
+def test_saved_token_is_ignored_for_another_server_or_user(taiga, monkeypatch, field, value):
+    server._save_token("token")
+    monkeypatch.setattr(server, "CFG", dataclasses.replace(server.CFG, **{field: value}))
+
+    assert server._load_token() is None
+
+
+def test_saved_token_is_ignored_close_to_expiry(taiga):
+    margin = server._TOKEN_EXPIRY_MARGIN
+    server._save_token(make_jwt({"exp": time.time() + margin - 5}))
+    assert server._load_token() is None
+
+    fresh = make_jwt({"exp": time.time() + margin + 60})
+    server._save_token(fresh)
+    assert server._load_token() == fresh
+
+
+@pytest.mark.parametrize("token", [
+    "opaque-application-token",
+    "not.base64!.jwt",
+    make_jwt({"sub": "user"}),
+    make_jwt({"exp": "tomorrow"}),
+])
+def test_token_expiry_is_none_without_a_numeric_exp_claim(token):
+    assert server._token_expiry(token) is None
+
+
+def test_token_expiry_reads_the_exp_claim():
+    assert server._token_expiry(make_jwt({"exp": 1700000000})) == 1700000000.0
+
+
+@pytest.mark.parametrize("contents", [
+    "not json",
+    "null",
+    "[]",
+    json.dumps({"api_url": "http://taiga.test", "username": "user", "token": 5}),
+    json.dumps({"api_url": "http://taiga.test", "username": "user", "token": "t", "exp": "soon"}),
+    json.dumps({"api_url": "http://taiga.test", "username": "user", "token": "t", "exp": True}),
+])
+@pytest.mark.asyncio
+async def test_corrupt_token_file_falls_back_to_password_login(taiga, contents):
+    server.CFG.token_path.write_text(contents)
+
+    assert server._load_token() is None
+    assert not server.CFG.token_path.exists()
+
+    server.CFG.token_path.write_text(contents)
+    await server._get_api()
+    assert taiga.logins == 1
+    assert server._load_token() == "token-1"
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_returns_results_in_request_order(taiga):
+    results = await server.get_tasks_many([3, 1, 2, 1])
+
+    assert [result["id"] for result in results] == [3, 1, 2, 1]
+    assert taiga.hits("/tasks/1") == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_limits_concurrent_requests(taiga):
+    await server._get_api()
+
+    results = await server.get_tasks_many(list(range(1, 41)))
+
+    assert len(results) == 40
+    assert taiga.max_active == server._BATCH_CONCURRENCY
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_fails_once_for_a_failed_id(taiga, caplog):
+    await server._get_api()
+    taiga.fail_next.add("/tasks/2")
+
+    with caplog.at_level(logging.ERROR, logger="server"):
+        with pytest.raises(TaigaException):
+            await server.get_tasks_many([1, 2, 3])
+
+    tool_errors = [record for record in caplog.records
+                   if record.name == "server" and record.levelno >= logging.ERROR]
+    assert [record.getMessage() for record in tool_errors] == [
+        "Taiga API error in get_tasks_many: API Error 500: Server error"]
+
+
+@pytest.mark.asyncio
+async def test_batch_tool_logs_in_again_on_expired_token(taiga):
+    await server._get_api()
+    taiga.expire_token()
+
+    results = await server.get_tasks_many([1, 2])
+
+    assert [result["id"] for result in results] == [1, 2]
+    assert taiga.logins == 2
+
+
+@pytest.mark.asyncio
+async def test_importing_server_keeps_the_default_event_loop():
+    uvloop = pytest.importorskip("uvloop")
+
+    assert not isinstance(asyncio.get_running_loop(), uvloop.Loop)